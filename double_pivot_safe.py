@@ -1,22 +1,72 @@
 #!/usr/bin/env python3
 
 import argparse
-import json
+import functools
+import hashlib
 import os
+import random
 import time
 import re
-from kubernetes import client, config
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import orjson
+import urllib3
+from kubernetes import client, config, watch
 
 # -------------------------------------------------------------------------
 # Setup Kubernetes client
 # -------------------------------------------------------------------------
-config.load_kube_config()
-v1 = client.CoreV1Api()
-apps_v1 = client.AppsV1Api()
-batch_v1 = client.BatchV1Api()
+# Built by init_clients() from main(), so importing the module or running --help
+# never needs a kubeconfig.
+v1 = None
+apps_v1 = None
+batch_v1 = None
+storage_v1 = None
+
+def init_clients(parallelism):
+    # One ApiClient for all API groups, with a pool large enough that concurrent
+    # pivots reuse kept-alive connections instead of reconnecting (urllib3 default: 4).
+    global v1, apps_v1, batch_v1, storage_v1
+    cfg = client.Configuration()
+    config.load_kube_config(client_configuration=cfg)
+    cfg.connection_pool_maxsize = max(32, 4 * parallelism)
+    cfg.retries = urllib3.Retry(total=5, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504))
+    api_client = client.ApiClient(cfg)
+    v1 = client.CoreV1Api(api_client)
+    apps_v1 = client.AppsV1Api(api_client)
+    batch_v1 = client.BatchV1Api(api_client)
+    storage_v1 = client.StorageV1Api(api_client)
 
 DEFAULT_METADATA_FILE = "double_pivot_metadata.json"
+PROGRESS_FILE = "double_pivot_metadata.jsonl"
 SCALE_TRACK_FILE = "workload_scale_backup.json"
+WATCH_TIMEOUT = 3600
+JOB_WAIT_SLICE = 300
+PIVOT_JOB_BACKOFF_LIMIT = 2
+PIVOT_JOB_TTL_SECONDS = 60
+PIVOT_JOB_DEADLINE_SECONDS = 86400
+PIVOT_LABEL_KEY = "app"
+PIVOT_LABEL_VALUE = "pvc-pivot"
+PIVOT_LABELS = {PIVOT_LABEL_KEY: PIVOT_LABEL_VALUE}
+PIVOT_LABEL_SELECTOR = f"{PIVOT_LABEL_KEY}={PIVOT_LABEL_VALUE}"
+LIST_PAGE_SIZE = 500
+LIST_HEADERS = {"Accept-Encoding": "gzip"}
+DELETE_TIMEOUT = 600
+SCALE_PATCH_WORKERS = 16
+FIELD_MANAGER = "pvc-migrator"
+CLONE_BIND_TIMEOUT = 300
+_POD_NAME_RE = re.compile(r'[^a-z0-9-]')
+# Pinned to a supported release so every copy runs the same busybox. Pivot pods set
+# imagePullPolicy: IfNotPresent explicitly, so a node that already has it skips the pull.
+DEFAULT_PIVOT_IMAGE = "alpine:3.22"
+_pivot_image = DEFAULT_PIVOT_IMAGE
+_copy_slots = threading.BoundedSemaphore(4)
+
+def configure_pivot_jobs(pipeline_depth, image):
+    global _copy_slots, _pivot_image
+    _copy_slots = threading.BoundedSemaphore(pipeline_depth)
+    _pivot_image = image
 
 # -------------------------------------------------------------------------
 # Argument parsing
@@ -29,200 +79,633 @@ def parse_args():
     parser.add_argument("--recreate", action="store_true", help="Phase 2: finalize migration")
     parser.add_argument("--dry-run", action="store_true", help="Simulate actions")
     parser.add_argument("--set-replica-0", action="store_true", help="Ensure workloads are scaled down before copying")
-    return parser.parse_args()
+    parser.add_argument("--parallelism", type=int, default=4, help="Number of PVCs to migrate concurrently (default: 4)")
+    parser.add_argument("--copy-parallelism", type=int, default=1, help="Parallel tar streams inside each pivot pod (default: 1)")
+    parser.add_argument("--pipeline-depth", type=int, help="Maximum pivot jobs in flight at once (default: --parallelism)")
+    parser.add_argument("--pivot-image", default=DEFAULT_PIVOT_IMAGE, help=f"Image for pivot jobs; needs busybox sh and tar (default: {DEFAULT_PIVOT_IMAGE})")
+    parser.add_argument("--clone", action="store_true", help="Clone PVCs on the storage backend when both SCs use the same CSI driver, instead of copying")
+    args = parser.parse_args()
+    if args.pipeline_depth is None:
+        args.pipeline_depth = args.parallelism
+    if min(args.parallelism, args.copy_parallelism, args.pipeline_depth) < 1:
+        parser.error("--parallelism, --copy-parallelism and --pipeline-depth must be at least 1")
+    return args
 
 # -------------------------------------------------------------------------
 # PVC and Pod helpers
 # -------------------------------------------------------------------------
+def iter_raw(list_call, namespace, label_selector=None):
+    # Raw JSON pages: skips building OpenAPI models for objects that are only scanned
+    # or mostly discarded, and bounds memory by the page size. Pages are requested
+    # gzipped (the apiserver compresses large LIST bodies); urllib3 inflates resp.data.
+    continue_token = None
+    while True:
+        resp = list_call(
+            namespace,
+            label_selector=label_selector,
+            limit=LIST_PAGE_SIZE,
+            _continue=continue_token,
+            _preload_content=False,
+            _headers=LIST_HEADERS
+        )
+        page = orjson.loads(resp.data)
+        yield from page.get("items") or []
+        continue_token = page["metadata"].get("continue")
+        if not continue_token:
+            break
+
+def iter_raw_pvcs(namespace):
+    return iter_raw(v1.list_namespaced_persistent_volume_claim, namespace)
+
 def list_pvcs(namespace, storage_class):
-    return [p for p in v1.list_namespaced_persistent_volume_claim(namespace).items if p.spec.storage_class_name == storage_class]
+    pvcs = namespace_cache(namespace).get_pvcs().values()
+    return [p for p in pvcs if p["spec"].get("storageClassName") == storage_class]
+
+def delete_pvc(namespace, name):
+    v1.delete_namespaced_persistent_volume_claim(name, namespace)
+    namespace_cache(namespace).discard_pvc(name)
 
-def create_pvc(namespace, name, storage_class, size, access_modes, dry_run):
+def create_pvc(namespace, name, storage_class, size, access_modes, dry_run, clone_from=None):
     if dry_run:
         print(f"[DRY-RUN] Create PVC '{name}' in SC '{storage_class}' ({size})")
         return
-    body = client.V1PersistentVolumeClaim(
-        metadata=client.V1ObjectMeta(name=name),
-        spec=client.V1PersistentVolumeClaimSpec(
-            storage_class_name=storage_class,
-            access_modes=access_modes,
-            resources=client.V1ResourceRequirements(requests={"storage": size})
-        )
+    # Server-side apply: creates the PVC on the first run and is a no-op on re-runs,
+    # without a failed create and 409 round trip.
+    body = {
+        "apiVersion": "v1",
+        "kind": "PersistentVolumeClaim",
+        "metadata": {"name": name},
+        "spec": {
+            "storageClassName": storage_class,
+            "accessModes": access_modes,
+            "resources": {"requests": {"storage": size}}
+        }
+    }
+    if clone_from:
+        body["spec"]["dataSource"] = {"kind": "PersistentVolumeClaim", "name": clone_from}
+    resp = v1.patch_namespaced_persistent_volume_claim(
+        name,
+        namespace,
+        body,
+        field_manager=FIELD_MANAGER,
+        force=True,
+        _content_type="application/apply-patch+yaml",
+        _preload_content=False
     )
-    try:
-        v1.create_namespaced_persistent_volume_claim(namespace, body)
-        print(f"[+] Created PVC '{name}'")
-    except client.exceptions.ApiException as e:
-        if e.status == 409:
-            print(f"[!] PVC '{name}' already exists. Skipping creation.")
-        else:
+    pvc = orjson.loads(resp.data)
+    namespace_cache(namespace).put_pvc(pvc)
+    print(f"[+] Applied PVC '{name}'")
+    return pvc
+
+# Set on Ctrl-C: running per-PVC steps stop before their next create or delete
+_stop = threading.Event()
+
+def check_stopped():
+    if _stop.is_set():
+        raise RuntimeError("interrupted")
+
+def backoff(attempt, base=0.25, cap=8.0):
+    # Capped exponential delay with jitter so parallel waiters don't poll in lockstep
+    return min(cap, base * (2 ** attempt)) * random.uniform(0.5, 1.5)
+
+def wait_for_deletion(read, namespace, name, what):
+    deadline = time.monotonic() + DELETE_TIMEOUT
+    attempt = 0
+    while time.monotonic() < deadline:
+        try:
+            read(name, namespace)
+        except client.exceptions.ApiException as e:
+            if e.status == 404:
+                return
             raise
+        time.sleep(backoff(attempt))
+        attempt += 1
+    raise RuntimeError(f"{what} '{name}' still exists after {DELETE_TIMEOUT}s")
+
+def wait_for_pvc_deleted(namespace, name):
+    wait_for_deletion(v1.read_namespaced_persistent_volume_claim, namespace, name, "PVC")
 
+@functools.lru_cache(maxsize=1024)
 def sanitize_pod_name(name, prefix):
-    base = re.sub(r'[^a-z0-9\-]', '', name.lower())[:20].rstrip('-')
-    return f"{prefix}-{base}"
+    base = _POD_NAME_RE.sub('', name.lower())[:20].rstrip('-')
+    # PVCs sharing a 20-char prefix would collide once pivots run concurrently.
+    digest = hashlib.sha1(name.encode()).hexdigest()[:6]
+    return f"{prefix}-{base}-{digest}"
+
+def build_copy_command(streams):
+    # Busybox tar ships with the image: no package install before the copy, and no
+    # rsync delta checks against a destination that always starts out empty.
+    if streams <= 1:
+        return "set -o pipefail; tar -C /old -cf - . | tar -C /new -xpf -"
+    # One tar pipe per top-level entry, `streams` at a time. Those pipes never
+    # touch the volume root itself, so its mode and owner are copied separately.
+    return (
+        "set -o pipefail; cd /old && "
+        "find . -mindepth 1 -maxdepth 1 -print0 | "
+        f"xargs -0 -r -n 1 -P {streams} sh -c "
+        "'set -o pipefail; tar -C /old -cf - \"$1\" | tar -C /new -xpf -' _ && "
+        "chown \"$(stat -c %u:%g /old)\" /new && chmod \"$(stat -c %a /old)\" /new"
+    )
 
-def copy_data(namespace, src, dst, prefix, dry_run):
-    pod_name = sanitize_pod_name(src, prefix)
+def run_pivot_job(namespace, job):
+    job_name = job["metadata"]["name"]
+    check_stopped()
+    try:
+        created = batch_v1.create_namespaced_job(namespace, job)
+    except client.exceptions.ApiException as e:
+        if e.status != 409:
+            raise
+        # Left over from an interrupted run: its pods may still be writing to dst
+        print(f"[!] Pivot job '{job_name}' already exists. Replacing it.")
+        batch_v1.delete_namespaced_job(
+            name=job_name,
+            namespace=namespace,
+            body=client.V1DeleteOptions(propagation_policy="Foreground")
+        )
+        wait_for_deletion(batch_v1.read_namespaced_job, namespace, job_name, "Job")
+        created = batch_v1.create_namespaced_job(namespace, job)
+    try:
+        print(f"[~] Waiting for job '{job_name}'...")
+        outcome = wait_for_job_completion(namespace, created)
+    finally:
+        # Delete right away instead of waiting for the TTL: the job's pods hold both
+        # PVCs, and phase 2 deletes and recreates them straight after the copy.
+        try:
+            batch_v1.delete_namespaced_job(
+                name=job_name,
+                namespace=namespace,
+                body=client.V1DeleteOptions(propagation_policy="Background")
+            )
+            print(f"[x] Deleted pivot job '{job_name}'")
+        except client.exceptions.ApiException as e:
+            if e.status != 404:
+                print(f"[!] Could not delete pivot job '{job_name}': {e}")
+    return outcome
+
+def copy_data(namespace, src, dst, dst_uid, prefix, dry_run, copy_streams=1):
+    job_name = sanitize_pod_name(src, prefix)
     if dry_run:
-        print(f"[DRY-RUN] Copy data {src} -> {dst} via pod {pod_name}")
+        print(f"[DRY-RUN] Copy data {src} -> {dst} via job {job_name}")
         return
-    pod = {
-        "apiVersion": "v1",
-        "kind": "Pod",
-        "metadata": {"name": pod_name},
+    # A Job rather than a bare Pod: evictions and transient pull errors are retried,
+    # and Complete/Failed conditions give the wait a definite end.
+    job = {
+        "apiVersion": "batch/v1",
+        "kind": "Job",
+        "metadata": {"name": job_name, "labels": PIVOT_LABELS},
         "spec": {
-            "restartPolicy": "Never",
-            "containers": [{
-                "name": "copy",
-                "image": "alpine",
-                "command": ["sh", "-c", "apk add rsync && rsync -a /old/ /new/ && sleep 2"],
-                "volumeMounts": [
-                    {"name": "src", "mountPath": "/old"},
-                    {"name": "dst", "mountPath": "/new"}
-                ]
-            }],
-            "volumes": [
-                {"name": "src", "persistentVolumeClaim": {"claimName": src}},
-                {"name": "dst", "persistentVolumeClaim": {"claimName": dst}}
-            ]
+            "backoffLimit": PIVOT_JOB_BACKOFF_LIMIT,
+            "activeDeadlineSeconds": PIVOT_JOB_DEADLINE_SECONDS,
+            "ttlSecondsAfterFinished": PIVOT_JOB_TTL_SECONDS,
+            "template": {
+                "spec": {
+                    "restartPolicy": "Never",
+                    "containers": [{
+                        "name": "copy",
+                        "image": _pivot_image,
+                        "imagePullPolicy": "IfNotPresent",
+                        "command": ["sh", "-c", build_copy_command(copy_streams)],
+                        "volumeMounts": [
+                            {"name": "src", "mountPath": "/old"},
+                            {"name": "dst", "mountPath": "/new"}
+                        ]
+                    }],
+                    "volumes": [
+                        {"name": "src", "persistentVolumeClaim": {"claimName": src}},
+                        {"name": "dst", "persistentVolumeClaim": {"claimName": dst}}
+                    ]
+                }
+            }
         }
     }
-    v1.create_namespaced_pod(namespace, pod)
-    print(f"[~] Waiting for pod '{pod_name}'...")
+    # Owned by the destination PVC, so the garbage collector removes a job that a
+    # crashed or interrupted run left behind once that PVC goes away.
+    job["metadata"]["ownerReferences"] = [{
+        "apiVersion": "v1",
+        "kind": "PersistentVolumeClaim",
+        "name": dst,
+        "uid": dst_uid,
+        "blockOwnerDeletion": False
+    }]
+    # Temp PVCs are cheap to create, so with --pipeline-depth below --parallelism
+    # the next PVCs get provisioned while earlier copies hold the slots.
+    if not _copy_slots.acquire(blocking=False):
+        print(f"[~] Copy {src} -> {dst} queued until a pivot slot frees up")
+        _copy_slots.acquire()
+    try:
+        outcome = run_pivot_job(namespace, job)
+    finally:
+        _copy_slots.release()
+    if outcome == "Failed":
+        raise RuntimeError(f"Copy {src} -> {dst} failed (job '{job_name}')")
+
+# -------------------------------------------------------------------------
+# Namespace cache
+# -------------------------------------------------------------------------
+# Latest PVC list of one namespace, shared by all pivot threads. Re-listed once
+# older than `ttl` seconds; the script's own applies and deletes update it in
+# place, so they need no extra LIST or GET.
+class NamespaceCache:
+    def __init__(self, namespace, ttl=30):
+        self.namespace = namespace
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._pvcs = {}
+        self._fetched_at = None
+
+    def _refresh_if_stale(self):
+        if self._fetched_at is None or time.monotonic() - self._fetched_at > self.ttl:
+            self._pvcs = {p["metadata"]["name"]: p for p in iter_raw_pvcs(self.namespace)}
+            self._fetched_at = time.monotonic()
+
+    def get_pvcs(self):
+        with self._lock:
+            self._refresh_if_stale()
+            return dict(self._pvcs)
+
+    def put_pvc(self, pvc):
+        with self._lock:
+            self._pvcs[pvc["metadata"]["name"]] = pvc
+
+    def discard_pvc(self, name):
+        with self._lock:
+            self._pvcs.pop(name, None)
+
+@functools.lru_cache(maxsize=None)
+def namespace_cache(namespace):
+    return NamespaceCache(namespace)
+
+# -------------------------------------------------------------------------
+# Storage-side clone
+# -------------------------------------------------------------------------
+# When both StorageClasses use the same CSI provisioner, a PVC with a dataSource
+# lets the driver copy the volume inside the storage backend, skipping the pivot job.
+# Opt-in (--clone): a Bound PVC does not prove the driver honoured the dataSource,
+# and phase 2 deletes the source right after.
+@functools.lru_cache(maxsize=None)
+def read_storage_class(name):
+    # Cluster-scoped and unchanged for the run
+    return storage_v1.read_storage_class(name)
+
+def clone_supported(source_sc, target_sc):
+    try:
+        source = read_storage_class(source_sc)
+        target = read_storage_class(target_sc)
+    except client.exceptions.ApiException as e:
+        print(f"[!] Could not read StorageClasses for clone check ({e.status}). Copying with pivot jobs")
+        return False
+    if source.provisioner != target.provisioner:
+        return False
+    # Only CSI drivers implement PVC cloning; in-tree and external provisioners
+    # may ignore dataSource and bind an empty volume
+    try:
+        storage_v1.read_csi_driver(target.provisioner)
+    except client.exceptions.ApiException as e:
+        if e.status != 404:
+            print(f"[!] Could not read CSIDriver '{target.provisioner}' ({e.status}). Copying with pivot jobs")
+        else:
+            print(f"[~] Provisioner '{target.provisioner}' is not a CSI driver. Copying with pivot jobs")
+        return False
+    # Such a clone stays Pending until a pod mounts it, so there is nothing to
+    # wait on to tell whether the driver actually cloned
+    if target.volume_binding_mode == "WaitForFirstConsumer":
+        print(f"[~] SC '{target_sc}' binds on first consumer. Copying with pivot jobs instead of cloning")
+        return False
+    print(f"[~] SCs '{source_sc}' and '{target_sc}' share CSI driver '{target.provisioner}'. Cloning PVCs")
+    return True
+
+def wait_for_pvc_bound(namespace, name, timeout):
+    # Each connect starts without a resourceVersion, so it replays the PVC's
+    # current state and a reconnect cannot miss the Bound transition.
+    deadline = time.monotonic() + timeout
+    remaining = timeout
+    attempt = 0
+    while remaining > 0:
+        try:
+            w = watch.Watch()
+            for event in w.stream(
+                v1.list_namespaced_persistent_volume_claim,
+                namespace,
+                field_selector=f"metadata.name={name}",
+                timeout_seconds=int(remaining) + 1,
+                _request_timeout=remaining + 60
+            ):
+                attempt = 0
+                pvc = event["object"]
+                if pvc.status and pvc.status.phase == "Bound":
+                    w.stop()
+                    return True
+        except client.exceptions.ApiException as e:
+            # With timeout_seconds set, the client raises a 410 instead of retrying
+            if e.status != 410:
+                raise
+        except urllib3.exceptions.HTTPError as e:
+            print(f"[!] Watch on PVC '{name}' interrupted, reconnecting: {e}")
+            time.sleep(min(backoff(attempt), max(0, deadline - time.monotonic())))
+            attempt += 1
+        remaining = deadline - time.monotonic()
+    return False
+
+def clone_or_copy(namespace, src, dst, storage_class, size, modes, prefix, dry_run, copy_streams, use_clone):
+    check_stopped()
+    if use_clone:
+        if dry_run:
+            print(f"[DRY-RUN] Clone PVC '{src}' into '{dst}' in SC '{storage_class}' ({size})")
+            return True
+        try:
+            create_pvc(namespace, dst, storage_class, size, modes, dry_run, clone_from=src)
+            if wait_for_pvc_bound(namespace, dst, CLONE_BIND_TIMEOUT):
+                print(f"[+] Cloned '{src}' into '{dst}' on the storage backend")
+                return True
+            print(f"[!] Clone '{dst}' not Bound after {CLONE_BIND_TIMEOUT}s. Falling back to a pivot job")
+        except client.exceptions.ApiException as e:
+            # 422: e.g. a plain PVC of the same name left by an earlier run (dataSource is immutable)
+            if e.status != 422:
+                raise
+            print(f"[!] Could not clone '{src}' into '{dst}': {e.reason}. Falling back to a pivot job")
+        try:
+            delete_pvc(namespace, dst)
+        except client.exceptions.ApiException as e:
+            if e.status != 404:
+                raise
+        wait_for_pvc_deleted(namespace, dst)
+        check_stopped()
+
+    applied = create_pvc(namespace, dst, storage_class, size, modes, dry_run)
+    dst_uid = applied["metadata"]["uid"] if applied else None
+    copy_data(namespace, src, dst, dst_uid, prefix=prefix, dry_run=dry_run, copy_streams=copy_streams)
+    return False
+
+# -------------------------------------------------------------------------
+# Pivot job watcher
+# -------------------------------------------------------------------------
+# A single labelled watch per namespace serves every in-flight copy, rather than
+# one stream per job. Outcomes are keyed by job UID so a stale event for an
+# earlier job with the same name can never complete a newer one.
+_pivot_lock = threading.Lock()
+_pivot_outcomes = {}
+_pivot_waiters = {}
+_pivot_watched_namespaces = set()
+
+def job_outcome(job):
+    for cond in (job.status and job.status.conditions) or []:
+        if cond.type in ("Complete", "Failed") and cond.status == "True":
+            return cond.type
+    return None
+
+def watch_pivot_jobs(namespace):
+    # The first connect replays current state as ADDED events; reconnects resume
+    # from the last resourceVersion seen, so nothing in between is missed.
+    resource_version = None
+    attempt = 0
     while True:
-        p = v1.read_namespaced_pod(pod_name, namespace)
-        if p.status.phase in ["Succeeded", "Failed"]:
-            break
-        time.sleep(2)
-    v1.delete_namespaced_pod(pod_name, namespace)
-    print(f"[x] Deleted pivot pod '{pod_name}'")
+        try:
+            w = watch.Watch()
+            for event in w.stream(
+                batch_v1.list_namespaced_job,
+                namespace,
+                label_selector=PIVOT_LABEL_SELECTOR,
+                resource_version=resource_version,
+                timeout_seconds=WATCH_TIMEOUT,
+                _request_timeout=WATCH_TIMEOUT + 60
+            ):
+                attempt = 0
+                job = event["object"]
+                resource_version = job.metadata.resource_version
+                outcome = job_outcome(job)
+                if event["type"] == "DELETED" and not outcome:
+                    outcome = "Failed"
+                if outcome:
+                    # Only jobs someone is waiting on; later events (e.g. our own
+                    # delete) would otherwise leave entries nothing removes
+                    with _pivot_lock:
+                        done = _pivot_waiters.get(job.metadata.uid)
+                        if done:
+                            _pivot_outcomes[job.metadata.uid] = outcome
+                            done.set()
+        except client.exceptions.ApiException as e:
+            # With timeout_seconds set, the client raises ERROR events as ApiException
+            if e.status == 410:
+                # resourceVersion too old (compacted): relist from the current state.
+                # A job deleted in the gap is not replayed, so wake every waiter to
+                # read its job directly.
+                resource_version = None
+                wake_pivot_waiters()
+                continue
+            print(f"[!] Pivot job watch interrupted, reconnecting: {e}")
+            time.sleep(backoff(attempt))
+            attempt += 1
+        except Exception as e:
+            # Transport errors, but also anything unexpected (e.g. an event that fails
+            # to deserialize): nothing restarts this thread, so it must not die
+            print(f"[!] Pivot job watch interrupted, reconnecting: {e}")
+            time.sleep(backoff(attempt))
+            attempt += 1
+
+def wake_pivot_waiters():
+    with _pivot_lock:
+        for done in _pivot_waiters.values():
+            done.set()
+
+def ensure_pivot_watcher(namespace):
+    with _pivot_lock:
+        if namespace in _pivot_watched_namespaces:
+            return
+        _pivot_watched_namespaces.add(namespace)
+    threading.Thread(target=watch_pivot_jobs, args=(namespace,), name=f"pivot-watch-{namespace}", daemon=True).start()
+
+def read_job_outcome(namespace, name, uid):
+    try:
+        job = batch_v1.read_namespaced_job(name, namespace)
+    except client.exceptions.ApiException as e:
+        if e.status != 404:
+            raise
+        return "Failed"
+    # Gone and replaced by a newer job of the same name
+    if job.metadata.uid != uid:
+        return "Failed"
+    return job_outcome(job)
+
+def wait_for_job_completion(namespace, job):
+    ensure_pivot_watcher(namespace)
+    name, uid = job.metadata.name, job.metadata.uid
+    done = threading.Event()
+    with _pivot_lock:
+        _pivot_waiters[uid] = done
+    try:
+        # The job may have finished before the waiter was registered
+        outcome = read_job_outcome(namespace, name, uid)
+        while not outcome:
+            # Bounded, so a dead or stuck watcher (or an event it never saw)
+            # costs at most one slice before the job is read directly
+            done.wait(JOB_WAIT_SLICE)
+            # Interrupted: run_pivot_job's finally deletes the job
+            check_stopped()
+            with _pivot_lock:
+                done.clear()
+                outcome = _pivot_outcomes.pop(uid, None)
+            if not outcome:
+                outcome = read_job_outcome(namespace, name, uid)
+        return outcome
+    finally:
+        with _pivot_lock:
+            del _pivot_waiters[uid]
+            _pivot_outcomes.pop(uid, None)
 
 # -------------------------------------------------------------------------
 # Workload Scale Helpers
 # -------------------------------------------------------------------------
-def detect_and_scale_down(namespace, pvc_names, dry_run):
-    replicas_backup = {}
+def pod_template_volumes(workload):
+    return workload["spec"]["template"]["spec"].get("volumes")
+
+VOLUME_EXTRACTORS = {
+    "Deployment": pod_template_volumes,
+    "ReplicaSet": pod_template_volumes,
+    "StatefulSet": pod_template_volumes,
+    "DaemonSet": pod_template_volumes,
+    "Job": pod_template_volumes,
+    "CronJob": lambda cj: cj["spec"]["jobTemplate"]["spec"]["template"]["spec"].get("volumes"),
+}
+
+def scale_down(kind, patch_scale):
+    def action(namespace, workload, dry_run):
+        name = workload["metadata"]["name"]
+        replicas = workload["spec"].get("replicas") or 0
+        if replicas == 0:
+            print(f"[=] {kind} '{name}' is already scaled to 0")
+            return replicas, None
+        print(f"[=] Scaling down {kind} '{name}'...")
+        if dry_run:
+            print(f"[DRY-RUN] Would scale {kind} '{name}' to 0")
+            return replicas, None
+        return replicas, lambda: patch_scale(name=name, namespace=namespace, body={"spec": {"replicas": 0}})
+    return action
+
+def pause_daemon_set(namespace, ds, dry_run):
+    name = ds["metadata"]["name"]
+    if (ds["spec"]["template"]["spec"].get("nodeSelector") or {}).get("migration-paused") == "true":
+        print(f"[=] DaemonSet '{name}' is already paused")
+        return "patched", None
+    print(f"[=] Pausing DaemonSet '{name}' (nodeSelector patch)...")
+    if dry_run:
+        print(f"[DRY-RUN] Would patch DaemonSet '{name}' with nodeSelector")
+        return "patched", None
+    patch_body = {"spec": {"template": {"spec": {"nodeSelector": {"migration-paused": "true"}}}}}
+    return "patched", lambda: apps_v1.patch_namespaced_daemon_set(
+        name=name, namespace=namespace, body=patch_body,
+        _content_type="application/strategic-merge-patch+json"
+    )
 
-    deployments = apps_v1.list_namespaced_deployment(namespace).items
-    statefulsets = apps_v1.list_namespaced_stateful_set(namespace).items
-    replicasets = apps_v1.list_namespaced_replica_set(namespace).items
-    daemonsets = apps_v1.list_namespaced_daemon_set(namespace).items
-    cronjobs = batch_v1.list_namespaced_cron_job(namespace).items
-    jobs = batch_v1.list_namespaced_job(namespace).items
-
-    def match_pvc_template(workload):
-        volumes = []
-        if hasattr(workload.spec, "template"):
-            volumes = workload.spec.template.spec.volumes or []
-        elif hasattr(workload.spec, "job_template"):
-            volumes = workload.spec.job_template.spec.template.spec.volumes or []
-        elif hasattr(workload.spec, "volumes"):
-            volumes = workload.spec.volumes or []
-        for vol in volumes:
-            pvc = vol.persistent_volume_claim
-            if pvc and pvc.claim_name in pvc_names:
-                return True
-        return False
+def suspend_cron_job(namespace, cj, dry_run):
+    name = cj["metadata"]["name"]
+    if cj["spec"].get("suspend"):
+        # Not recorded, so scale_back_up leaves it suspended as we found it
+        print(f"[=] CronJob '{name}' is already suspended")
+        return None, None
+    print(f"[=] Suspending CronJob '{name}'...")
+    if dry_run:
+        print(f"[DRY-RUN] Would suspend CronJob '{name}'")
+        return True, None
+    return True, lambda: batch_v1.patch_namespaced_cron_job(
+        name=name,
+        namespace=namespace,
+        body={"spec": {"suspend": True}}
+    )
 
-    for deploy in deployments:
-        if match_pvc_template(deploy):
-            replicas = deploy.spec.replicas
-            print(f"[=] Scaling down Deployment '{deploy.metadata.name}'...")
-            if replicas > 0:
-                if dry_run:
-                    print(f"[DRY-RUN] Would scale Deployment '{deploy.metadata.name}' to 0")
-                else:
-                    apps_v1.patch_namespaced_deployment_scale(
-                        name=deploy.metadata.name,
-                        namespace=namespace,
-                        body={"spec": {"replicas": 0}}
-                    )
-            replicas_backup[deploy.metadata.uid] = ("Deployment", deploy.metadata.name, replicas)
-
-    for rs in replicasets:
-        if match_pvc_template(rs):
-            replicas = rs.spec.replicas or 0
-            print(f"[=] Scaling down ReplicaSet '{rs.metadata.name}'...")
-            if replicas > 0:
-                if dry_run:
-                    print(f"[DRY-RUN] Would scale ReplicaSet '{rs.metadata.name}' to 0")
-                else:
-                    apps_v1.patch_namespaced_replica_set_scale(
-                        name=rs.metadata.name,
-                        namespace=namespace,
-                        body={"spec": {"replicas": 0}}
-                    )
-            replicas_backup[rs.metadata.uid] = ("ReplicaSet", rs.metadata.name, replicas)
-
-    for sts in statefulsets:
-        volume_claim_names = [tpl.metadata.name for tpl in sts.spec.volume_claim_templates or []]
-        found_match = False
-        for pvc_name in pvc_names:
-            for vct_name in volume_claim_names:
-                if pvc_name.startswith(f"{vct_name}-{sts.metadata.name}-"):
-                    found_match = True
-                    break
-            if found_match:
-                break
-        for vol in sts.spec.template.spec.volumes or []:
-            pvc = vol.persistent_volume_claim
-            if pvc and pvc.claim_name in pvc_names:
-                found_match = True
-                break
-        if found_match:
-            replicas = sts.spec.replicas
-            print(f"[=] Scaling down StatefulSet '{sts.metadata.name}'...")
-            if replicas > 0:
-                if dry_run:
-                    print(f"[DRY-RUN] Would scale StatefulSet '{sts.metadata.name}' to 0")
-                else:
-                    apps_v1.patch_namespaced_stateful_set_scale(
-                        name=sts.metadata.name,
-                        namespace=namespace,
-                        body={"spec": {"replicas": 0}}
-                    )
-            replicas_backup[sts.metadata.uid] = ("StatefulSet", sts.metadata.name, replicas)
-
-    for ds in daemonsets:
-        if match_pvc_template(ds):
-            print(f"[=] Pausing DaemonSet '{ds.metadata.name}' (nodeSelector patch)...")
-            if dry_run:
-                print(f"[DRY-RUN] Would patch DaemonSet '{ds.metadata.name}' with nodeSelector")
-            else:
-                patch_body = {"spec": {"template": {"spec": {"nodeSelector": {"migration-paused": "true"}}}}}
-                apps_v1.patch_namespaced_daemon_set(name=ds.metadata.name, namespace=namespace, body=patch_body)
-            replicas_backup[ds.metadata.uid] = ("DaemonSet", ds.metadata.name, "patched")
+def delete_job(namespace, job, dry_run):
+    name = job["metadata"]["name"]
+    if job["metadata"].get("deletionTimestamp"):
+        print(f"[=] Job '{name}' is already being deleted")
+        return "deleted", None
+    print(f"[=] Deleting active Job '{name}'...")
+    if dry_run:
+        print(f"[DRY-RUN] Would delete Job '{name}'")
+        return "deleted", None
+    return "deleted", lambda: batch_v1.delete_namespaced_job(
+        name=name,
+        namespace=namespace,
+        body=client.V1DeleteOptions(propagation_policy="Background")
+    )
 
-    for cj in cronjobs:
-        if match_pvc_template(cj):
-            print(f"[=] Suspending CronJob '{cj.metadata.name}'...")
-            if dry_run:
-                print(f"[DRY-RUN] Would suspend CronJob '{cj.metadata.name}'")
-            else:
-                batch_v1.patch_namespaced_cron_job(
-                    name=cj.metadata.name,
-                    namespace=namespace,
-                    body={"spec": {"suspend": True}}
-                )
-            replicas_backup[cj.metadata.uid] = ("CronJob", cj.metadata.name, True)
+def workload_kinds():
+    # (kind, list call, label selector, scale-down action). An action returns the value
+    # scale_back_up restores from (None: nothing to restore) and the API call to make, if any.
+    return [
+        ("Deployment", apps_v1.list_namespaced_deployment, None, scale_down("Deployment", apps_v1.patch_namespaced_deployment_scale)),
+        ("ReplicaSet", apps_v1.list_namespaced_replica_set, None, scale_down("ReplicaSet", apps_v1.patch_namespaced_replica_set_scale)),
+        ("StatefulSet", apps_v1.list_namespaced_stateful_set, None, scale_down("StatefulSet", apps_v1.patch_namespaced_stateful_set_scale)),
+        ("DaemonSet", apps_v1.list_namespaced_daemon_set, None, pause_daemon_set),
+        ("CronJob", batch_v1.list_namespaced_cron_job, None, suspend_cron_job),
+        # Our own pivot jobs mount these PVCs too; leave them to the pivot code
+        ("Job", batch_v1.list_namespaced_job, f"{PIVOT_LABEL_KEY}!={PIVOT_LABEL_VALUE}", delete_job),
+    ]
+
+def index_workloads(namespace, pvc_names):
+    # One LIST per kind and a single pass over each workload's volumes. Returns the
+    # PVC -> [(kind, name)] index and the matching workloads with their action.
+    pvc_names = set(pvc_names)
+    # StatefulSet claims are named "<template>-<statefulset>-<ordinal>"
+    sts_claims = {}
+    for name in pvc_names:
+        prefix, _, ordinal = name.rpartition("-")
+        if prefix and ordinal.isdigit():
+            sts_claims.setdefault(prefix, []).append(name)
+
+    pvc_index = {}
+    workloads = []
+    matched_uids = set()
+    for kind, list_workloads, label_selector, scale_down_action in workload_kinds():
+        extract_volumes = VOLUME_EXTRACTORS[kind]
+        for workload in iter_raw(list_workloads, namespace, label_selector):
+            # A ReplicaSet owned by a matched Deployment follows its scale; patching
+            # it too would only fight the Deployment controller
+            owners = workload["metadata"].get("ownerReferences") or []
+            if kind == "ReplicaSet" and any(o.get("controller") and o["uid"] in matched_uids for o in owners):
+                continue
+            claims = {
+                vol["persistentVolumeClaim"]["claimName"]
+                for vol in extract_volumes(workload) or []
+                if vol.get("persistentVolumeClaim") and vol["persistentVolumeClaim"]["claimName"] in pvc_names
+            }
+            if kind == "StatefulSet":
+                for tpl in workload["spec"].get("volumeClaimTemplates") or []:
+                    claims.update(sts_claims.get(f"{tpl['metadata']['name']}-{workload['metadata']['name']}", []))
+            if claims:
+                matched_uids.add(workload["metadata"]["uid"])
+                workloads.append((kind, workload, scale_down_action))
+                for claim in claims:
+                    pvc_index.setdefault(claim, []).append((kind, workload["metadata"]["name"]))
+    return pvc_index, workloads
 
-    for job in jobs:
-        if match_pvc_template(job):
-            print(f"[=] Deleting active Job '{job.metadata.name}'...")
-            if dry_run:
-                print(f"[DRY-RUN] Would delete Job '{job.metadata.name}'")
-            else:
-                batch_v1.delete_namespaced_job(
-                    name=job.metadata.name,
-                    namespace=namespace,
-                    body=client.V1DeleteOptions(propagation_policy="Background")
-                )
-            replicas_backup[job.metadata.uid] = ("Job", job.metadata.name, "deleted")
+def detect_and_scale_down(namespace, pvc_names, dry_run):
+    pvc_index, workloads = index_workloads(namespace, pvc_names)
+    for claim in sorted(pvc_index):
+        users = ", ".join(f"{kind} '{name}'" for kind, name in pvc_index[claim])
+        print(f"[=] PVC '{claim}' is used by {users}")
 
-    if not dry_run:
-        with open(SCALE_TRACK_FILE, "w") as f:
-            json.dump(replicas_backup, f)
+    replicas_backup = {}
+    patches = []
+    for kind, workload, scale_down_action in workloads:
+        value, patch = scale_down_action(namespace, workload, dry_run)
+        if value is not None:
+            metadata = workload["metadata"]
+            replicas_backup[metadata["uid"]] = (kind, metadata["name"], value)
+        if patch:
+            patches.append(patch)
+
+    try:
+        if patches:
+            with ThreadPoolExecutor(max_workers=SCALE_PATCH_WORKERS) as executor:
+                list(executor.map(lambda patch: patch(), patches))
+    finally:
+        # Written even if a patch failed, so whatever was scaled down can still be restored
+        if not dry_run:
+            # A resumed run sees workloads it already scaled to 0; keep the original counts
+            if os.path.exists(SCALE_TRACK_FILE):
+                with open(SCALE_TRACK_FILE, "rb") as f:
+                    replicas_backup.update(orjson.loads(f.read()))
+            with open(SCALE_TRACK_FILE, "wb") as f:
+                f.write(orjson.dumps(replicas_backup))
 
     return replicas_backup
 
@@ -233,8 +716,8 @@ def scale_back_up(namespace, dry_run):
     if not os.path.exists(SCALE_TRACK_FILE):
         print("[!] No scale backup file found. Cannot restore replicas.")
         return
-    with open(SCALE_TRACK_FILE) as f:
-        backups = json.load(f)
+    with open(SCALE_TRACK_FILE, "rb") as f:
+        backups = orjson.loads(f.read())
 
     for uid, (kind, name, value) in backups.items():
         if kind == "Deployment":
@@ -271,14 +754,16 @@ def scale_back_up(namespace, dry_run):
                 )
 
         elif kind == "DaemonSet":
-            print(f"[+] Unpausing DaemonSet '{name}' (removing nodeSelector)")
+            print(f"[+] Unpausing DaemonSet '{name}' (removing migration-paused nodeSelector)")
             if dry_run:
                 print(f"[DRY-RUN] Would unpatch DaemonSet '{name}'")
             else:
+                # Drop only our key; the DaemonSet's own nodeSelector entries stay intact
                 apps_v1.patch_namespaced_daemon_set(
                     name=name,
                     namespace=namespace,
-                    body={"spec": {"template": {"spec": {"nodeSelector": None}}}}
+                    body={"spec": {"template": {"spec": {"nodeSelector": {"migration-paused": None}}}}},
+                    _content_type="application/strategic-merge-patch+json"
                 )
 
         elif kind == "CronJob":
@@ -298,12 +783,141 @@ def scale_back_up(namespace, dry_run):
     if not dry_run:
         os.remove(SCALE_TRACK_FILE)
 
+# -------------------------------------------------------------------------
+# Migration metadata
+# -------------------------------------------------------------------------
+# Phase 1 appends one line per finished copy, so a crash or Ctrl-C part-way
+# through keeps every completed copy on record and a re-run resumes from there.
+# The file stays open for the whole phase (one open/close, not one per PVC);
+# flushing each line still gets it to disk if the process dies.
+_progress_lock = threading.Lock()
+_progress_file = None
+
+def record_progress(record):
+    global _progress_file
+    with _progress_lock:
+        if _progress_file is None:
+            _progress_file = open(PROGRESS_FILE, "ab")
+        _progress_file.write(orjson.dumps(record) + b"\n")
+        _progress_file.flush()
+
+def close_progress():
+    global _progress_file
+    with _progress_lock:
+        if _progress_file is not None:
+            _progress_file.close()
+            _progress_file = None
+
+def load_progress():
+    if not os.path.exists(PROGRESS_FILE):
+        return []
+    records = []
+    good_bytes = 0
+    with open(PROGRESS_FILE, "rb+") as f:
+        for line in f:
+            try:
+                records.append(orjson.loads(line))
+            except orjson.JSONDecodeError:
+                # Torn final line from an interrupted write: drop it so new
+                # records are not appended onto the fragment
+                f.truncate(good_bytes)
+                break
+            good_bytes += len(line)
+    return records
+
+def load_metadata():
+    if os.path.exists(PROGRESS_FILE):
+        print(f"[~] Phase 1 did not finish. Using the copies recorded in '{PROGRESS_FILE}'")
+        return load_progress()
+    if os.path.exists(DEFAULT_METADATA_FILE):
+        with open(DEFAULT_METADATA_FILE, "rb") as f:
+            return orjson.loads(f.read())
+    return None
+
+# -------------------------------------------------------------------------
+# Per-PVC pivot steps
+# -------------------------------------------------------------------------
+def run_per_pvc(step, items, parallelism, describe):
+    # Each step is dominated by apiserver and copy-job waits, so threads overlap well.
+    # A failing PVC is reported and the others carry on; results keep input order
+    # with None for the failures.
+    results = [None] * len(items)
+    failed = 0
+    executor = ThreadPoolExecutor(max_workers=max(1, min(parallelism, len(items))))
+    try:
+        futures = {executor.submit(step, item): i for i, item in enumerate(items)}
+        for future in as_completed(futures):
+            i = futures[future]
+            try:
+                results[i] = future.result()
+            except Exception as e:
+                print(f"[!] {describe(items[i])} failed: {e}")
+                failed += 1
+    except BaseException:
+        # Ctrl-C: drop queued PVCs and stop running ones at their next create or
+        # delete; pivot waiters wake so their jobs are cleaned up
+        print("[!] Interrupted. Cancelling queued PVCs; running ones stop before their next change")
+        _stop.set()
+        wake_pivot_waiters()
+        executor.shutdown(wait=False, cancel_futures=True)
+        raise
+    executor.shutdown()
+    return results, failed
+
+def pivot_one(namespace, pvc, target_sc, dry_run, copy_streams, use_clone):
+    old_name = pvc["metadata"]["name"]
+    temp_name = f"{old_name}-temp"
+    size = pvc["spec"]["resources"]["requests"]["storage"]
+    modes = pvc["spec"]["accessModes"]
+
+    cloned = clone_or_copy(namespace, old_name, temp_name, target_sc, size, modes, "pivot1", dry_run, copy_streams, use_clone)
+
+    record = {
+        "old_name": old_name,
+        "temp_name": temp_name,
+        "size": size,
+        "modes": modes,
+        # Phase 2 clones back only what the driver already cloned once
+        "cloned": cloned
+    }
+    if not dry_run:
+        record_progress(record)
+    return record
+
+def restore_one(namespace, record, target_sc, dry_run, copy_streams, use_clone, existing):
+    if record["temp_name"] not in existing:
+        print(f"[!] Temp PVC '{record['temp_name']}' not found. Skipping '{record['old_name']}'")
+        return
+    check_stopped()
+    if record["old_name"] in existing and not dry_run:
+        try:
+            delete_pvc(namespace, record["old_name"])
+            print(f"[x] Deleted original PVC '{record['old_name']}'")
+            wait_for_pvc_deleted(namespace, record["old_name"])
+        except client.exceptions.ApiException as e:
+            print(f"[!] Could not delete original PVC '{record['old_name']}': {e}")
+
+    clone_or_copy(
+        namespace, record["temp_name"], record["old_name"], target_sc, record["size"], record["modes"],
+        "pivot2", dry_run, copy_streams, use_clone and record.get("cloned", False)
+    )
+
+    if not dry_run:
+        check_stopped()
+        try:
+            delete_pvc(namespace, record["temp_name"])
+            print(f"[x] Deleted temp PVC '{record['temp_name']}'")
+        except client.exceptions.ApiException as e:
+            print(f"[!] Could not delete temp PVC '{record['temp_name']}': {e}")
+
 # -------------------------------------------------------------------------
 # Main execution
 # -------------------------------------------------------------------------
 def main():
     args = parse_args()
     ns = args.namespace
+    configure_pivot_jobs(args.pipeline_depth, args.pivot_image)
+    init_clients(args.parallelism)
 
     if not args.recreate:
         pvcs = list_pvcs(ns, args.origin_sc)
@@ -311,64 +925,65 @@ def main():
             print(f"[!] No PVCs found in SC '{args.origin_sc}'")
             return
 
-        pvc_names = [p.metadata.name for p in pvcs]
+        pvc_names = [p["metadata"]["name"] for p in pvcs]
+        use_clone = args.clone and clone_supported(args.origin_sc, args.target_sc)
 
         if args.set_replica_0:
             print("[=] Scaling workloads using these PVCs to 0 before starting...")
             detect_and_scale_down(ns, pvc_names, args.dry_run)
 
-        metadata = []
-        for pvc in pvcs:
-            old_name = pvc.metadata.name
-            temp_name = f"{old_name}-temp"
-            size = pvc.spec.resources.requests["storage"]
-            modes = pvc.spec.access_modes
-
-            create_pvc(ns, temp_name, args.target_sc, size, modes, args.dry_run)
-            copy_data(ns, old_name, temp_name, prefix="pivot1", dry_run=args.dry_run)
-
-            metadata.append({
-                "old_name": old_name,
-                "temp_name": temp_name,
-                "size": size,
-                "modes": modes
-            })
+        done = [] if args.dry_run else load_progress()
+        done_names = {r["old_name"] for r in done}
+        pending = [p for p in pvcs if p["metadata"]["name"] not in done_names]
+        if done:
+            print(f"[~] Resuming: {len(done)} PVC(s) already copied, {len(pending)} left")
+
+        try:
+            copied, failed = run_per_pvc(
+                lambda pvc: pivot_one(ns, pvc, args.target_sc, args.dry_run, args.copy_parallelism, use_clone),
+                pending,
+                args.parallelism,
+                lambda pvc: f"Pivot of PVC '{pvc['metadata']['name']}'"
+            )
+        finally:
+            close_progress()
+        if failed:
+            print(f"[!] {failed} PVC(s) failed. Finished copies are kept in '{PROGRESS_FILE}'; re-run Phase 1 to retry the rest")
+            return 1
+        metadata = done + copied
 
         if not args.dry_run:
-            with open(DEFAULT_METADATA_FILE, "w") as f:
-                json.dump(metadata, f, indent=2)
+            with open(DEFAULT_METADATA_FILE, "wb") as f:
+                f.write(orjson.dumps(metadata, option=orjson.OPT_INDENT_2))
+            if os.path.exists(PROGRESS_FILE):
+                os.remove(PROGRESS_FILE)
             print(f"[~] Phase 1 complete. Delete old PVCs and run with --recreate")
 
     else:
-        if not os.path.exists(DEFAULT_METADATA_FILE):
+        records = load_metadata()
+        if records is None:
             print("[!] No metadata found")
             return
-        with open(DEFAULT_METADATA_FILE) as f:
-            records = json.load(f)
-
-        for r in records:
-            if not args.dry_run:
-                try:
-                    v1.delete_namespaced_persistent_volume_claim(r["old_name"], ns)
-                    print(f"[x] Deleted original PVC '{r['old_name']}'")
-                    time.sleep(2)
-                except client.exceptions.ApiException as e:
-                    print(f"[!] Could not delete original PVC '{r['old_name']}': {e}")
-
-            create_pvc(ns, r["old_name"], args.target_sc, r["size"], r["modes"], args.dry_run)
-            copy_data(ns, r["temp_name"], r["old_name"], prefix="pivot2", dry_run=args.dry_run)
-
-            if not args.dry_run:
-                try:
-                    v1.delete_namespaced_persistent_volume_claim(r["temp_name"], ns)
-                    print(f"[x] Deleted temp PVC '{r['temp_name']}'")
-                except client.exceptions.ApiException as e:
-                    print(f"[!] Could not delete temp PVC '{r['temp_name']}': {e}")
+
+        # One LIST up front instead of discovering missing PVCs through 404/409 responses
+        existing = set(namespace_cache(ns).get_pvcs())
+        _, failed = run_per_pvc(
+            lambda r: restore_one(ns, r, args.target_sc, args.dry_run, args.copy_parallelism, args.clone, existing),
+            records,
+            args.parallelism,
+            lambda r: f"Restore of PVC '{r['old_name']}'"
+        )
+        if failed:
+            # Workloads stay scaled down: restarting them now could mount an empty PVC
+            print(f"[!] {failed} PVC(s) failed. Workloads were left scaled down; re-run with --recreate to retry")
+            return 1
 
         scale_back_up(ns, args.dry_run)
 
         if not args.dry_run:
-            os.remove(DEFAULT_METADATA_FILE)
+            for path in (DEFAULT_METADATA_FILE, PROGRESS_FILE):
+                if os.path.exists(path):
+                    os.remove(path)
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())